@@ -15,7 +15,7 @@ class MyDB:
 
     def saveStrings(self, arr):
         with open(self.fname, 'wb') as f:
-            pickle.dump(arr, f)
+            pickle.dump(arr, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def saveString(self, s):
         arr = self.loadStrings()
@@ -8,8 +8,8 @@ def dict_factory(cursor, row):
 
 class SquirrelDB:
 
-    def __init__(self):
-        self.connection = sqlite3.connect("squirrel_db.db")
+    def __init__(self, filename="squirrel_db.db"):
+        self.connection = sqlite3.connect(filename)
         self.connection.row_factory = dict_factory
         self.cursor = self.connection.cursor()
 
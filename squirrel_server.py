@@ -1,3 +1,4 @@
+import argparse
 import json
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import parse_qs
@@ -5,6 +6,8 @@ from squirrel_db import SquirrelDB
 
 class SquirrelServerHandler(BaseHTTPRequestHandler):
 
+    dbPath = "squirrel_db.db"
+
     # HTTP METHODS
 
     def do_GET(self):
@@ -70,7 +73,7 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
     # ACTIONS
 
     def handleSquirrelsIndex(self):
-        db = SquirrelDB()
+        db = SquirrelDB(self.dbPath)
         squirrelsList = db.getSquirrels()
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
@@ -78,7 +81,7 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
         self.wfile.write(bytes(json.dumps(squirrelsList), "utf-8"))
 
     def handleSquirrelsRetrieve(self, squirrelId):
-        db = SquirrelDB()
+        db = SquirrelDB(self.dbPath)
         squirrel = db.getSquirrel(squirrelId)
         if squirrel:
             self.send_response(200)
@@ -89,7 +92,7 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
             self.handle404()
 
     def handleSquirrelsCreate(self):
-        db = SquirrelDB()
+        db = SquirrelDB(self.dbPath)
         body = self.getRequestData()
         # Validate required fields
         if "name" not in body or "size" not in body:
@@ -100,7 +103,7 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def handleSquirrelsUpdate(self, squirrelId):
-        db = SquirrelDB()
+        db = SquirrelDB(self.dbPath)
         squirrel = db.getSquirrel(squirrelId)
         if squirrel:
             body = self.getRequestData()
@@ -115,7 +118,7 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
             self.handle404()
 
     def handleSquirrelsDelete(self, squirrelId):
-        db = SquirrelDB()
+        db = SquirrelDB(self.dbPath)
         squirrel = db.getSquirrel(squirrelId)
         if squirrel:
             db.deleteSquirrel(squirrelId)
@@ -136,12 +139,17 @@ class SquirrelServerHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(bytes("404 Not Found", "utf-8"))
 
-def run():
-    print("squirrel_server running at 127.0.0.1:8080")
-    listen = ("127.0.0.1", 8080)
+def run(port=8080, dbPath="squirrel_db.db"):
+    print(f"squirrel_server running at 127.0.0.1:{port}")
+    SquirrelServerHandler.dbPath = dbPath
+    listen = ("127.0.0.1", port)
     server = HTTPServer(listen, SquirrelServerHandler)
     server.serve_forever()
 
 if __name__ == '__main__':
-    run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db-path", default="squirrel_db.db")
+    args = parser.parse_args()
+    run(args.port, args.db_path)
 
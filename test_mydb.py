@@ -1,9 +1,19 @@
+import mmap
 import os
 import pickle
 import pytest
 from mydb import MyDB
 
 
+def _load(path):
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return pickle.loads(mm)
+        finally:
+            mm.close()
+
+
 def describe_MyDB():
 
     def describe_init():
@@ -15,21 +25,17 @@ def describe_MyDB():
             db = MyDB(str(test_file))
             
             assert os.path.exists(test_file)
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == []
+            assert db.loadStrings() == []
 
         def it_uses_existing_file_when_file_exists(tmp_path):
             test_file = tmp_path / "test_init_existing.db"
             existing_data = ["existing_string_1", "existing_string_2"]
             with open(test_file, 'wb') as f:
-                pickle.dump(existing_data, f)
+                pickle.dump(existing_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             
             db = MyDB(str(test_file))
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == existing_data
+            assert db.loadStrings() == existing_data
 
         def it_stores_filename_in_instance_variable(tmp_path):
             test_file = tmp_path / "test_init_fname.db"
@@ -48,7 +54,7 @@ def describe_MyDB():
             test_file = tmp_path / "test_load_single.db"
             test_data = ["single_string"]
             with open(test_file, 'wb') as f:
-                pickle.dump(test_data, f)
+                pickle.dump(test_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             db = MyDB(str(test_file))
             
             result = db.loadStrings()
@@ -58,7 +64,7 @@ def describe_MyDB():
             test_file = tmp_path / "test_load_multiple.db"
             test_data = ["first", "second", "third", "fourth"]
             with open(test_file, 'wb') as f:
-                pickle.dump(test_data, f)
+                pickle.dump(test_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             db = MyDB(str(test_file))
             
             result = db.loadStrings()
@@ -69,7 +75,7 @@ def describe_MyDB():
             test_file = tmp_path / "test_load_special.db"
             test_data = ["", "spaces  here", "line\nbreak", "tab\there", "unicode: 你好", "123"]
             with open(test_file, 'wb') as f:
-                pickle.dump(test_data, f)
+                pickle.dump(test_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             db = MyDB(str(test_file))
             
             result = db.loadStrings()
@@ -83,9 +89,7 @@ def describe_MyDB():
             
             db.saveStrings([])
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == []
+            assert db.loadStrings() == []
 
         def it_saves_single_string_to_file(tmp_path):
             test_file = tmp_path / "test_save_single.db"
@@ -94,9 +98,7 @@ def describe_MyDB():
             
             db.saveStrings(test_data)
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == test_data
+            assert db.loadStrings() == test_data
 
         def it_saves_multiple_strings_to_file(tmp_path):
             test_file = tmp_path / "test_save_multiple.db"
@@ -105,8 +107,7 @@ def describe_MyDB():
             
             db.saveStrings(test_data)
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
+            content = _load(test_file)
             assert content == test_data
             assert len(content) == 4
 
@@ -114,14 +115,13 @@ def describe_MyDB():
             test_file = tmp_path / "test_save_overwrite.db"
             initial_data = ["old1", "old2", "old3"]
             with open(test_file, 'wb') as f:
-                pickle.dump(initial_data, f)
+                pickle.dump(initial_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             db = MyDB(str(test_file))
             
             new_data = ["new1", "new2"]
             db.saveStrings(new_data)
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
+            content = db.loadStrings()
             assert content == new_data
             assert len(content) == 2
 
@@ -132,9 +132,7 @@ def describe_MyDB():
             
             db.saveStrings(test_data)
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == test_data
+            assert db.loadStrings() == test_data
 
     def describe_saveString():
 
@@ -144,22 +142,18 @@ def describe_MyDB():
             
             db.saveString("first_string")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == ["first_string"]
+            assert db.loadStrings() == ["first_string"]
 
         def it_appends_string_to_existing_data(tmp_path):
             test_file = tmp_path / "test_append_to_existing.db"
             initial_data = ["existing1", "existing2"]
             with open(test_file, 'wb') as f:
-                pickle.dump(initial_data, f)
+                pickle.dump(initial_data, f, protocol=pickle.HIGHEST_PROTOCOL)
             db = MyDB(str(test_file))
             
             db.saveString("new_string")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == ["existing1", "existing2", "new_string"]
+            assert db.loadStrings() == ["existing1", "existing2", "new_string"]
 
         def it_appends_multiple_strings_sequentially(tmp_path):
             test_file = tmp_path / "test_append_multiple.db"
@@ -170,9 +164,7 @@ def describe_MyDB():
             db.saveString("third")
             db.saveString("fourth")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == ["first", "second", "third", "fourth"]
+            assert db.loadStrings() == ["first", "second", "third", "fourth"]
 
         def it_preserves_empty_string(tmp_path):
             test_file = tmp_path / "test_append_empty.db"
@@ -182,9 +174,7 @@ def describe_MyDB():
             db.saveString("")
             db.saveString("after")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == ["before", "", "after"]
+            assert db.loadStrings() == ["before", "", "after"]
 
         def it_preserves_special_characters_in_appended_string(tmp_path):
             test_file = tmp_path / "test_append_special.db"
@@ -194,8 +184,7 @@ def describe_MyDB():
             db.saveString("tab\there")
             db.saveString("unicode: こんにちは")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
+            content = db.loadStrings()
             assert content[0] == "line\nbreak"
             assert content[1] == "tab\there"
             assert content[2] == "unicode: こんにちは"
@@ -218,6 +207,4 @@ def describe_MyDB():
             
             db.saveString("final")
             
-            with open(test_file, 'rb') as f:
-                content = pickle.load(f)
-            assert content == ["replaced1", "replaced2", "replaced3", "final"]
+            assert db.loadStrings() == ["replaced1", "replaced2", "replaced3", "final"]
@@ -1,96 +1,131 @@
-import subprocess
-import time
-import json
-import shutil
+import functools
+import os
 import sqlite3
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+import threading
+from http.client import HTTPConnection, RemoteDisconnected
+from http.server import HTTPServer
 from urllib.parse import urlencode
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 import pytest
-import signal
-import os
+from squirrel_server import SquirrelServerHandler
+
+HOST = "127.0.0.1"
+WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+DB_PATH = f"squirrel_db_{WORKER or 'test'}.db"
+_conn = None
+_db_conn = None
+_write_conn = None
+
+class WorkerSquirrelServerHandler(SquirrelServerHandler):
+    dbPath = DB_PATH
 
-BASE_URL = "http://127.0.0.1:8080"
+    def log_message(self, format, *args):
+        if os.environ.get("SQUIRREL_DEBUG"):
+            super().log_message(format, *args)
 
 class ServerFixture:
     def __init__(self):
-        self.process = None
+        self.httpd = None
+        self.thread = None
     
     def start(self):
-        self.process = subprocess.Popen(
-            ["python3", "squirrel_server.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            preexec_fn=os.setsid
-        )
-        time.sleep(1.5)
-        
-        max_retries = 10
-        for i in range(max_retries):
-            try:
-                urlopen(f"{BASE_URL}/squirrels", timeout=1)
-                return
-            except (URLError, HTTPError):
-                if i < max_retries - 1:
-                    time.sleep(0.5)
-                else:
-                    raise Exception("Server failed to start")
+        global _conn
+        self.httpd = HTTPServer((HOST, 0), WorkerSquirrelServerHandler)
+        port = self.httpd.server_address[1]
+        _conn = HTTPConnection(HOST, port)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
     
     def stop(self):
-        if self.process:
-            try:
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
-                self.process.wait(timeout=5)
-            except:
-                try:
-                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
-                except:
-                    pass
+        if _conn:
+            _conn.close()
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
 
 @pytest.fixture(scope="session")
-def server():
+def server(db_connection):
     srv = ServerFixture()
     srv.start()
     yield srv
     srv.stop()
 
-@pytest.fixture(autouse=True)
-def reset_database():
-    shutil.copy("empty_squirrel_db.db", "squirrel_db.db")
-    time.sleep(0.1)
-    yield
-    if os.path.exists("squirrel_db.db"):
-        shutil.copy("empty_squirrel_db.db", "squirrel_db.db")
+@pytest.fixture(scope="session")
+def db_connection():
+    global _write_conn
+    template = sqlite3.connect("empty_squirrel_db.db")
+    conn = sqlite3.connect(DB_PATH)
+    template.backup(conn)
+    template.close()
+    _write_conn = conn
+    yield conn
+    conn.close()
+    if _db_conn is not None:
+        _db_conn.close()
+    os.remove(DB_PATH)
+
+@pytest.fixture
+def reset_database(db_connection):
+    db_connection.execute("DELETE FROM squirrels")
+    db_connection.commit()
+
+@functools.lru_cache(maxsize=512)
+def _encode(items):
+    return urlencode(items).encode('utf-8')
 
 def make_request(method, path, data=None):
-    url = f"{BASE_URL}{path}"
-    
     if data:
-        data_encoded = urlencode(data).encode('utf-8')
+        data_encoded = _encode(tuple(sorted(data.items())))
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
     else:
         data_encoded = None
-    
-    request = Request(url, data=data_encoded, method=method)
+        headers = {}
     
     try:
-        response = urlopen(request)
-        status_code = response.getcode()
-        headers = dict(response.headers)
-        body = response.read().decode('utf-8')
-        return {'status_code': status_code, 'headers': headers, 'body': body}
-    except HTTPError as e:
-        status_code = e.code
-        headers = dict(e.headers)
-        body = e.read().decode('utf-8')
-        return {'status_code': status_code, 'headers': headers, 'body': body}
+        _conn.request(method, path, body=data_encoded, headers=headers)
+        response = _conn.getresponse()
+    except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        _conn.close()
+        _conn.request(method, path, body=data_encoded, headers=headers)
+        response = _conn.getresponse()
+    
+    status_code = response.status
+    headers = dict(response.headers)
+    body = response.read()
+    return {'status_code': status_code, 'headers': headers, 'body': body}
+
+def seed_squirrels(rows):
+    cursor = _write_conn.cursor()
+    ids = []
+    with _write_conn:
+        for name, size in rows:
+            cursor.execute("INSERT INTO squirrels (name, size) VALUES (?, ?)", (name, size))
+            ids.append(cursor.lastrowid)
+    return ids
+
+def _read_conn():
+    global _db_conn
+    if _db_conn is None:
+        _db_conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False)
+        _db_conn.row_factory = sqlite3.Row
+        _db_conn.execute("PRAGMA query_only=1")
+    return _db_conn
+
+def last_id():
+    return _read_conn().execute("SELECT MAX(id) FROM squirrels").fetchone()[0]
+
+def record_ids():
+    return [row[0] for row in _read_conn().execute("SELECT id FROM squirrels ORDER BY id")]
+
+def record_by_index(index):
+    return _read_conn().execute("SELECT * FROM squirrels ORDER BY id LIMIT 1 OFFSET ?", (index,)).fetchone()
 
 def get_db_records():
-    conn = sqlite3.connect("squirrel_db.db")
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM squirrels ORDER BY id")
-    rows = cursor.fetchall()
-    conn.close()
+    rows = _read_conn().execute("SELECT * FROM squirrels ORDER BY id").fetchall()
     return [dict(row) for row in rows]
 
 
@@ -106,91 +141,80 @@ def describe_SquirrelServer_API():
             response = make_request('GET', '/squirrels')
             assert response['headers']['Content-Type'] == 'application/json'
 
-        def it_returns_empty_array_when_no_squirrels_exist(server):
+        def it_returns_empty_array_when_no_squirrels_exist(server, reset_database):
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body == []
 
-        def it_returns_array_with_single_squirrel(server):
-            make_request('POST', '/squirrels', {'name': 'TestSquirrel', 'size': 'medium'})
+        def it_returns_array_with_single_squirrel(server, reset_database):
+            seed_squirrels([('TestSquirrel', 'medium')])
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert len(body) == 1
             assert body[0]['name'] == 'TestSquirrel'
 
-        def it_returns_multiple_squirrels_in_order(server):
-            make_request('POST', '/squirrels', {'name': 'First', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'Second', 'size': 'medium'})
-            make_request('POST', '/squirrels', {'name': 'Third', 'size': 'large'})
+        def it_returns_multiple_squirrels_in_order(server, reset_database):
+            seed_squirrels([('First', 'small'), ('Second', 'medium'), ('Third', 'large')])
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert len(body) == 3
             assert body[0]['name'] == 'First'
             assert body[1]['name'] == 'Second'
 
         def it_includes_id_field_in_squirrel_objects(server):
-            make_request('POST', '/squirrels', {'name': 'IdTest', 'size': 'small'})
+            seed_squirrels([('IdTest', 'small')])
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert 'id' in body[0]
 
         def it_reflects_database_state_accurately(server):
-            make_request('POST', '/squirrels', {'name': 'DbTest1', 'size': 'tiny'})
-            make_request('POST', '/squirrels', {'name': 'DbTest2', 'size': 'huge'})
+            seed_squirrels([('DbTest1', 'tiny'), ('DbTest2', 'huge')])
             response = make_request('GET', '/squirrels')
-            db_records = get_db_records()
-            body = json.loads(response['body'])
-            assert len(body) == len(db_records)
+            body = _json.loads(response['body'])
+            assert len(body) == len(record_ids())
 
     def describe_GET_squirrels_retrieve():
 
         def it_returns_200_status_code_for_valid_id(server):
-            make_request('POST', '/squirrels', {'name': 'Findme', 'size': 'small'})
-            db_records = get_db_records()
-            squirrel_id = db_records[0]['id']
+            ids = seed_squirrels([('Findme', 'small')])
+            squirrel_id = ids[0]
             response = make_request('GET', f'/squirrels/{squirrel_id}')
             assert response['status_code'] == 200
 
         def it_returns_json_content_type_for_retrieve(server):
-            make_request('POST', '/squirrels', {'name': 'JsonTest', 'size': 'medium'})
-            db_records = get_db_records()
-            squirrel_id = db_records[0]['id']
+            ids = seed_squirrels([('JsonTest', 'medium')])
+            squirrel_id = ids[0]
             response = make_request('GET', f'/squirrels/{squirrel_id}')
             assert response['headers']['Content-Type'] == 'application/json'
 
         def it_returns_correct_squirrel_object(server):
-            make_request('POST', '/squirrels', {'name': 'SpecificSquirrel', 'size': 'large'})
-            db_records = get_db_records()
-            squirrel_id = db_records[0]['id']
+            ids = seed_squirrels([('SpecificSquirrel', 'large')])
+            squirrel_id = ids[0]
             response = make_request('GET', f'/squirrels/{squirrel_id}')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body['name'] == 'SpecificSquirrel'
             assert body['size'] == 'large'
 
         def it_returns_first_squirrel_when_multiple_exist(server):
-            make_request('POST', '/squirrels', {'name': 'FirstOne', 'size': 'tiny'})
-            make_request('POST', '/squirrels', {'name': 'SecondOne', 'size': 'huge'})
-            db_records = get_db_records()
-            first_id = db_records[0]['id']
+            ids = seed_squirrels([('FirstOne', 'tiny'), ('SecondOne', 'huge')])
+            first_id = ids[0]
             response = make_request('GET', f'/squirrels/{first_id}')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body['name'] == 'FirstOne'
 
         def it_returns_second_squirrel_when_requested(server):
-            make_request('POST', '/squirrels', {'name': 'First', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'Second', 'size': 'medium'})
-            db_records = get_db_records()
-            second_id = db_records[1]['id']
+            ids = seed_squirrels([('First', 'small'), ('Second', 'medium')])
+            second_id = ids[1]
             response = make_request('GET', f'/squirrels/{second_id}')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body['name'] == 'Second'
 
-        def it_matches_database_record_exactly(server):
-            make_request('POST', '/squirrels', {'name': 'ExactMatch', 'size': 'gigantic'})
+        def it_matches_database_record_exactly(server, reset_database):
+            seed_squirrels([('ExactMatch', 'gigantic')])
             db_records = get_db_records()
             squirrel_id = db_records[0]['id']
             response = make_request('GET', f'/squirrels/{squirrel_id}')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             db_record = db_records[0]
             assert body['id'] == db_record['id']
             assert body['name'] == db_record['name']
@@ -201,182 +225,153 @@ def describe_SquirrelServer_API():
             response = make_request('POST', '/squirrels', {'name': 'NewSquirrel', 'size': 'medium'})
             assert response['status_code'] == 201
 
-        def it_creates_squirrel_in_database(server):
+        def it_creates_squirrel_in_database(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'PersistTest', 'size': 'small'})
             records = get_db_records()
             assert len(records) == 1
             assert records[0]['name'] == 'PersistTest'
 
-        def it_assigns_id_to_created_squirrel(server):
+        def it_assigns_id_to_created_squirrel(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'IdAssign', 'size': 'large'})
-            records = get_db_records()
-            assert 'id' in records[0]
-            assert records[0]['id'] is not None
+            record = record_by_index(0)
+            assert record['name'] == 'IdAssign'
+            assert record['id'] is not None
 
-        def it_creates_multiple_squirrels_sequentially(server):
+        def it_creates_multiple_squirrels_sequentially(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'Multi1', 'size': 'tiny'})
             make_request('POST', '/squirrels', {'name': 'Multi2', 'size': 'medium'})
             make_request('POST', '/squirrels', {'name': 'Multi3', 'size': 'huge'})
-            records = get_db_records()
-            assert len(records) == 3
+            assert len(record_ids()) == 3
 
-        def it_preserves_name_with_special_characters(server):
+        def it_preserves_name_with_special_characters(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'Special-Name_123!', 'size': 'small'})
-            records = get_db_records()
-            assert records[0]['name'] == 'Special-Name_123!'
+            assert record_by_index(0)['name'] == 'Special-Name_123!'
 
-        def it_preserves_size_field_exactly(server):
+        def it_preserves_size_field_exactly(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'SizeTest', 'size': 'extra-large'})
-            records = get_db_records()
-            assert records[0]['size'] == 'extra-large'
+            assert record_by_index(0)['size'] == 'extra-large'
 
         def it_can_be_retrieved_after_creation(server):
             make_request('POST', '/squirrels', {'name': 'RetrieveAfter', 'size': 'medium'})
-            records = get_db_records()
-            created_id = records[0]['id']
+            created_id = last_id()
             response = make_request('GET', f'/squirrels/{created_id}')
             assert response['status_code'] == 200
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body['name'] == 'RetrieveAfter'
 
-        def it_appears_in_list_after_creation(server):
+        def it_appears_in_list_after_creation(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'ListTest', 'size': 'large'})
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert len(body) == 1
             assert body[0]['name'] == 'ListTest'
 
     def describe_PUT_squirrels_update():
 
         def it_returns_204_status_code_for_successful_update(server):
-            make_request('POST', '/squirrels', {'name': 'Original', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('Original', 'small')])
+            squirrel_id = ids[0]
             response = make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'Updated', 'size': 'large'})
             assert response['status_code'] == 204
 
-        def it_updates_name_in_database(server):
-            make_request('POST', '/squirrels', {'name': 'OldName', 'size': 'medium'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_updates_name_in_database(server, reset_database):
+            ids = seed_squirrels([('OldName', 'medium')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'NewName', 'size': 'medium'})
-            updated_records = get_db_records()
-            assert updated_records[0]['name'] == 'NewName'
+            assert record_by_index(0)['name'] == 'NewName'
 
-        def it_updates_size_in_database(server):
-            make_request('POST', '/squirrels', {'name': 'SizeUpdate', 'size': 'tiny'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_updates_size_in_database(server, reset_database):
+            ids = seed_squirrels([('SizeUpdate', 'tiny')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'SizeUpdate', 'size': 'gigantic'})
-            updated_records = get_db_records()
-            assert updated_records[0]['size'] == 'gigantic'
+            assert record_by_index(0)['size'] == 'gigantic'
 
-        def it_updates_both_name_and_size(server):
-            make_request('POST', '/squirrels', {'name': 'Before', 'size': 'before-size'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_updates_both_name_and_size(server, reset_database):
+            ids = seed_squirrels([('Before', 'before-size')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'After', 'size': 'after-size'})
-            updated_records = get_db_records()
-            assert updated_records[0]['name'] == 'After'
-            assert updated_records[0]['size'] == 'after-size'
+            updated_record = record_by_index(0)
+            assert updated_record['name'] == 'After'
+            assert updated_record['size'] == 'after-size'
 
-        def it_preserves_id_after_update(server):
-            make_request('POST', '/squirrels', {'name': 'IdPreserve', 'size': 'small'})
-            records = get_db_records()
-            original_id = records[0]['id']
+        def it_preserves_id_after_update(server, reset_database):
+            ids = seed_squirrels([('IdPreserve', 'small')])
+            original_id = ids[0]
             make_request('PUT', f'/squirrels/{original_id}', {'name': 'Updated', 'size': 'large'})
-            updated_records = get_db_records()
-            assert updated_records[0]['id'] == original_id
+            assert record_ids()[0] == original_id
 
-        def it_updates_only_specified_squirrel(server):
-            make_request('POST', '/squirrels', {'name': 'First', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'Second', 'size': 'medium'})
-            make_request('POST', '/squirrels', {'name': 'Third', 'size': 'large'})
-            records = get_db_records()
-            second_id = records[1]['id']
+        def it_updates_only_specified_squirrel(server, reset_database):
+            ids = seed_squirrels([('First', 'small'), ('Second', 'medium'), ('Third', 'large')])
+            second_id = ids[1]
             make_request('PUT', f'/squirrels/{second_id}', {'name': 'SecondUpdated', 'size': 'updated'})
             updated_records = get_db_records()
             assert updated_records[0]['name'] == 'First'
             assert updated_records[1]['name'] == 'SecondUpdated'
 
         def it_reflects_update_in_retrieve_endpoint(server):
-            make_request('POST', '/squirrels', {'name': 'BeforeRetrieve', 'size': 'old'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('BeforeRetrieve', 'old')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'AfterRetrieve', 'size': 'new'})
             response = make_request('GET', f'/squirrels/{squirrel_id}')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body['name'] == 'AfterRetrieve'
 
-        def it_reflects_update_in_list_endpoint(server):
-            make_request('POST', '/squirrels', {'name': 'ListBefore', 'size': 'before'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_reflects_update_in_list_endpoint(server, reset_database):
+            ids = seed_squirrels([('ListBefore', 'before')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'ListAfter', 'size': 'after'})
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert body[0]['name'] == 'ListAfter'
 
     def describe_DELETE_squirrels_delete():
 
         def it_returns_204_status_code_for_successful_delete(server):
-            make_request('POST', '/squirrels', {'name': 'ToDelete', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('ToDelete', 'small')])
+            squirrel_id = ids[0]
             response = make_request('DELETE', f'/squirrels/{squirrel_id}')
             assert response['status_code'] == 204
 
-        def it_removes_squirrel_from_database(server):
-            make_request('POST', '/squirrels', {'name': 'WillBeDeleted', 'size': 'medium'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_removes_squirrel_from_database(server, reset_database):
+            ids = seed_squirrels([('WillBeDeleted', 'medium')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
-            remaining_records = get_db_records()
-            assert len(remaining_records) == 0
+            assert len(record_ids()) == 0
 
-        def it_deletes_only_specified_squirrel(server):
-            make_request('POST', '/squirrels', {'name': 'Keep1', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'DeleteThis', 'size': 'medium'})
-            make_request('POST', '/squirrels', {'name': 'Keep2', 'size': 'large'})
-            records = get_db_records()
-            delete_id = records[1]['id']
+        def it_deletes_only_specified_squirrel(server, reset_database):
+            ids = seed_squirrels([('Keep1', 'small'), ('DeleteThis', 'medium'), ('Keep2', 'large')])
+            delete_id = ids[1]
             make_request('DELETE', f'/squirrels/{delete_id}')
             remaining = get_db_records()
             assert len(remaining) == 2
             assert remaining[0]['name'] == 'Keep1'
 
         def it_cannot_retrieve_deleted_squirrel(server):
-            make_request('POST', '/squirrels', {'name': 'WillBeGone', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('WillBeGone', 'small')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
             response = make_request('GET', f'/squirrels/{squirrel_id}')
             assert response['status_code'] == 404
 
-        def it_removes_squirrel_from_list(server):
-            make_request('POST', '/squirrels', {'name': 'NotInList', 'size': 'medium'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_removes_squirrel_from_list(server, reset_database):
+            ids = seed_squirrels([('NotInList', 'medium')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
             response = make_request('GET', '/squirrels')
-            body = json.loads(response['body'])
+            body = _json.loads(response['body'])
             assert len(body) == 0
 
-        def it_allows_deleting_first_of_multiple_squirrels(server):
-            make_request('POST', '/squirrels', {'name': 'DeleteFirst', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'KeepSecond', 'size': 'medium'})
-            records = get_db_records()
-            first_id = records[0]['id']
+        def it_allows_deleting_first_of_multiple_squirrels(server, reset_database):
+            ids = seed_squirrels([('DeleteFirst', 'small'), ('KeepSecond', 'medium')])
+            first_id = ids[0]
             make_request('DELETE', f'/squirrels/{first_id}')
             remaining = get_db_records()
             assert len(remaining) == 1
             assert remaining[0]['name'] == 'KeepSecond'
 
-        def it_allows_deleting_last_of_multiple_squirrels(server):
-            make_request('POST', '/squirrels', {'name': 'KeepFirst', 'size': 'small'})
-            make_request('POST', '/squirrels', {'name': 'DeleteLast', 'size': 'medium'})
-            records = get_db_records()
-            last_id = records[1]['id']
+        def it_allows_deleting_last_of_multiple_squirrels(server, reset_database):
+            ids = seed_squirrels([('KeepFirst', 'small'), ('DeleteLast', 'medium')])
+            last_id = ids[1]
             make_request('DELETE', f'/squirrels/{last_id}')
             remaining = get_db_records()
             assert len(remaining) == 1
@@ -397,23 +392,20 @@ def describe_SquirrelServer_API():
             assert response['status_code'] == 400
 
         def it_returns_400_when_updating_squirrel_without_name(server):
-            make_request('POST', '/squirrels', {'name': 'ValidSquirrel', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('ValidSquirrel', 'small')])
+            squirrel_id = ids[0]
             response = make_request('PUT', f'/squirrels/{squirrel_id}', {'size': 'large'})
             assert response['status_code'] == 400
 
         def it_returns_400_when_updating_squirrel_without_size(server):
-            make_request('POST', '/squirrels', {'name': 'ValidSquirrel', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('ValidSquirrel', 'small')])
+            squirrel_id = ids[0]
             response = make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'UpdatedName'})
             assert response['status_code'] == 400
 
         def it_returns_400_when_updating_squirrel_with_no_data(server):
-            make_request('POST', '/squirrels', {'name': 'ValidSquirrel', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('ValidSquirrel', 'small')])
+            squirrel_id = ids[0]
             response = make_request('PUT', f'/squirrels/{squirrel_id}', {})
             assert response['status_code'] == 400
 
@@ -425,21 +417,19 @@ def describe_SquirrelServer_API():
         def it_returns_bad_request_message_in_body(server):
             response = make_request('POST', '/squirrels', {'size': 'medium'})
             assert response['status_code'] == 400
-            assert '400 Bad Request' in response['body']
+            assert b'400 Bad Request' in response['body']
 
-        def it_does_not_create_squirrel_in_db_when_data_incomplete(server):
+        def it_does_not_create_squirrel_in_db_when_data_incomplete(server, reset_database):
             make_request('POST', '/squirrels', {'name': 'NoSize'})
-            records = get_db_records()
-            assert len(records) == 0
+            assert len(record_ids()) == 0
 
-        def it_does_not_update_squirrel_in_db_when_data_incomplete(server):
-            make_request('POST', '/squirrels', {'name': 'Original', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+        def it_does_not_update_squirrel_in_db_when_data_incomplete(server, reset_database):
+            ids = seed_squirrels([('Original', 'small')])
+            squirrel_id = ids[0]
             make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'Updated'})
-            updated_records = get_db_records()
-            assert updated_records[0]['name'] == 'Original'
-            assert updated_records[0]['size'] == 'small'
+            updated_record = record_by_index(0)
+            assert updated_record['name'] == 'Original'
+            assert updated_record['size'] == 'small'
 
     def describe_404_error_conditions():
 
@@ -489,28 +479,25 @@ def describe_SquirrelServer_API():
 
         def it_returns_404_not_found_message_in_body(server):
             response = make_request('GET', '/invalid_path')
-            assert response['body'] == '404 Not Found'
+            assert response['body'] == b'404 Not Found'
 
         def it_returns_404_for_deleted_squirrel_retrieve(server):
-            make_request('POST', '/squirrels', {'name': 'Temporary', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('Temporary', 'small')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
             response = make_request('GET', f'/squirrels/{squirrel_id}')
             assert response['status_code'] == 404
 
         def it_returns_404_for_deleted_squirrel_update(server):
-            make_request('POST', '/squirrels', {'name': 'Gone', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('Gone', 'small')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
             response = make_request('PUT', f'/squirrels/{squirrel_id}', {'name': 'Update', 'size': 'new'})
             assert response['status_code'] == 404
 
         def it_returns_404_for_deleted_squirrel_second_delete(server):
-            make_request('POST', '/squirrels', {'name': 'AlreadyGone', 'size': 'small'})
-            records = get_db_records()
-            squirrel_id = records[0]['id']
+            ids = seed_squirrels([('AlreadyGone', 'small')])
+            squirrel_id = ids[0]
             make_request('DELETE', f'/squirrels/{squirrel_id}')
             response = make_request('DELETE', f'/squirrels/{squirrel_id}')
             assert response['status_code'] == 404
@@ -523,6 +510,6 @@ def describe_SquirrelServer_API():
             response = make_request('GET', '/squirrels/-1')
             assert response['status_code'] == 404
 
-        def it_returns_404_for_GET_with_extra_path_segments(server):
+        def it_returns_404_for_GET_with_extra_path_segments(server, reset_database):
             response = make_request('GET', '/squirrels/1/extra')
             assert response['status_code'] == 404